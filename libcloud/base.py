@@ -26,10 +26,35 @@ from libcloud.interface import INodeDriverFactory, INodeDriver
 from libcloud.interface import INodeFactory, INode
 from libcloud.interface import INodeSizeFactory, INodeSize
 from libcloud.interface import INodeImageFactory, INodeImage
+import gzip
 import hashlib
+import socket
+import struct
 import StringIO
+import zlib
 from pipes import quote as pquote
 
+# Requests that can be resent on a fresh connection without side effects
+SAFE_METHODS = frozenset(('GET', 'HEAD'))
+
+# Cache of (namespace, xpath) pairs already rewritten by fixxpath
+_FIXED_XPATHS = {}
+
+def fixxpath(namespace, xpath):
+    """
+    Qualify every step of `xpath` with `namespace`, as ElementTree wants.
+
+    Drivers look up the same handful of paths for every element they
+    parse, so results are memoized.
+    """
+    try:
+        return _FIXED_XPATHS[(namespace, xpath)]
+    except KeyError:
+        fixed = "/".join(["{%s}%s" % (namespace, e)
+                          for e in xpath.split("/")])
+        _FIXED_XPATHS[(namespace, xpath)] = fixed
+        return fixed
+
 class Node(object):
     """
     A Base Node class to derive from.
@@ -155,9 +180,9 @@ class Response(object):
     connection = None
 
     def __init__(self, response):
-        self.body = response.read()
         self.status = response.status
         self.headers = dict(response.getheaders())
+        self.body = self.read_body(response)
         self.error = response.reason
 
         if not self.success():
@@ -165,6 +190,22 @@ class Response(object):
 
         self.object = self.parse_body()
 
+    def read_body(self, response):
+        """
+        Read the response body, decompressing it if the server gzipped it.
+
+        @return: Body as a C{str}.
+        """
+        body = response.read()
+        if self.headers.get('content-encoding') == 'gzip':
+            try:
+                body = gzip.GzipFile(fileobj=StringIO.StringIO(body)).read()
+            except (IOError, EOFError, struct.error, zlib.error), e:
+                raise Exception("Could not decompress gzip response "
+                                "(status %s): %s: %r"
+                                % (self.status, e, body))
+        return body
+
     def parse_body(self):
         """
         Parse response body.
@@ -207,38 +248,38 @@ class LoggingHTTPSConnection(httplib.HTTPSConnection):
     log = None
 
     def _log_response(self, r):
-        rv = "# -------- begin %d:%d response ----------\n" % (id(self), id(r))
-        ht = ""
         v = r.version
         if r.version == 10:
             v = "HTTP/1.0"
         if r.version == 11:
             v = "HTTP/1.1"
-        ht += "%s %s %s\r\n" % (v, r.status, r.reason)
+        # Collect the pieces and join them once, rather than growing a string
+        # with +=, so a large body is only copied a single time.
+        parts = ["%s %s %s\r\n" % (v, r.status, r.reason)]
         body = r.read()
         for h in r.getheaders():
-            ht += "%s: %s\r\n" % (h[0].title(), h[1])
-        ht += "\r\n"
+            parts.append("%s: %s\r\n" % (h[0].title(), h[1]))
+        parts.append("\r\n")
         # this is evil. laugh with me. ha arharhrhahahaha
         class fakesock:
             def __init__(self, s):
                 self.s = s
             def makefile(self, mode, foo):
                 return StringIO.StringIO(self.s)
-        rr = r
         if r.chunked:
-            ht += "%x\r\n" % (len(body))
-            ht += body
-            ht += "\r\n0\r\n"
+            parts.extend(["%x\r\n" % (len(body)), body, "\r\n0\r\n"])
         else:
-            ht += body
+            parts.append(body)
+        ht = "".join(parts)
         rr = httplib.HTTPResponse(fakesock(ht),
                                   method=r._method,
                                   debuglevel=r.debuglevel)
         rr.begin()
-        rv += ht
-        rv += ("\n# -------- end %d:%d response ----------\n"
-               % (id(self), id(r)))
+        rv = "".join(["# -------- begin %d:%d response ----------\n"
+                      % (id(self), id(r)),
+                      ht,
+                      "\n# -------- end %d:%d response ----------\n"
+                      % (id(self), id(r))])
         return (rr, rv)
 
     def getresponse(self):
@@ -285,6 +326,7 @@ class ConnectionKey(object):
 
     responseCls = Response
     connection = None
+    connection_used = False
     host = '127.0.0.1'
     port = (80, 443)
     secure = 1
@@ -316,6 +358,7 @@ class ConnectionKey(object):
 
         connection = self.conn_classes[self.secure](host, port)
         self.connection = connection
+        self.connection_used = False
 
     def _user_agent(self):
       return 'libcloud/%s (%s)%s' % (
@@ -369,20 +412,69 @@ class ConnectionKey(object):
         headers.update({'Content-Length': len(data)})
         headers.update({'User-Agent': self._user_agent()})
         headers.update({'Host': self.host})
+        # Ask for compressed bodies, which Response.read_body inflates. Not
+        # while debug logging, so the log keeps readable bodies and curl
+        # commands that can be replayed as-is.
+        conn_cls = self.conn_classes[self.secure]
+        if not (conn_cls and issubclass(conn_cls, LoggingHTTPSConnection)):
+            headers.update({'Accept-Encoding': 'gzip'})
         # Encode data if necessary
         if data != '':
             data = self.encode_data(data)
         url = '?'.join((action, urllib.urlencode(params)))
         
-        # Removed terrible hack...this a less-bad hack that doesn't execute a
-        # request twice, but it's still a hack.
-        self.connect()
-        self.connection.request(method=method, url=url, body=data,
-                                headers=headers)
-        response = self.responseCls(self.connection.getresponse())
+        # Reuse the connection made by connect() so that consecutive requests
+        # share one persistent (HTTP/1.1 keep-alive) socket instead of doing a
+        # fresh TCP and SSL handshake every time.
+        if self.connection is None:
+            self.connect()
+        # Only a socket that has already carried a response can have been
+        # dropped by the server while idle, and only requests without side
+        # effects are safe to send twice.
+        may_retry = self.connection_used and method in SAFE_METHODS
+        try:
+            raw_response = self._send_request(method, url, data, headers)
+        except (httplib.BadStatusLine, socket.error), e:
+            if not may_retry or isinstance(e, socket.timeout):
+                raise
+            # The server closed the idle connection before answering;
+            # reconnect and send the request once more.
+            self.connect()
+            raw_response = self._send_request(method, url, data, headers)
+        try:
+            response = self.responseCls(raw_response)
+        except (httplib.HTTPException, socket.error):
+            # The body couldn't be read, so the connection is unusable
+            self.close()
+            raise
         response.connection = self
         return response
 
+    def _send_request(self, method, url, data, headers):
+        try:
+            self.connection.request(method=method, url=url, body=data,
+                                    headers=headers)
+            response = self.connection.getresponse()
+        except:
+            # httplib refuses further requests on a connection whose request
+            # failed part way, so start afresh next time.
+            self.close()
+            raise
+        # httplib closes the socket itself when the server asks it to
+        self.connection_used = not getattr(response, 'will_close', False)
+        return response
+
+    def close(self):
+        """
+        Close the connection to the API server, if one is open.
+
+        The next request will establish a new connection.
+        """
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+        self.connection_used = False
+
     def add_default_params(self, params):
         """
         Adds default parameters (such as API key, version, etc.)
@@ -20,6 +20,7 @@ from libcloud.providers import Provider
 from libcloud.types import NodeState, InvalidCredsException
 from libcloud.base import Node, Response, ConnectionUserAndKey
 from libcloud.base import NodeDriver, NodeSize, NodeImage, NodeLocation
+from libcloud.base import fixxpath
 import base64
 import hmac
 from hashlib import sha256
@@ -34,6 +35,8 @@ EC2_EU_WEST_HOST = 'ec2.eu-west-1.amazonaws.com'
 API_VERSION = '2009-04-04'
 NAMESPACE = "http://ec2.amazonaws.com/doc/%s/" % (API_VERSION)
 
+TERMINATE_STATUSES = frozenset(('shutting-down', 'terminated'))
+
 """
 Sizes must be hardcoded, because Amazon doesn't provide an API to fetch them.
 From http://aws.amazon.com/ec2/instance-types/
@@ -161,8 +164,7 @@ class EC2Connection(ConnectionUserAndKey):
                        HTTPRequestURI + "\n" +
                        CanonicalizedQueryString <from the preceding step>
         """
-        keys = params.keys()
-        keys.sort()
+        keys = sorted(params)
         pairs = []
         for key in keys:
             pairs.append(urllib.quote(key, safe='') + '=' +
@@ -196,7 +198,7 @@ class EC2NodeDriver(NodeDriver):
 
     def _fixxpath(self, xpath):
         # ElementTree wants namespaces in its xpaths, so here we add them.
-        return "/".join(["{%s}%s" % (NAMESPACE, e) for e in xpath.split("/")])
+        return fixxpath(NAMESPACE, xpath)
 
     def _findattr(self, element, xpath):
         return element.findtext(self._fixxpath(xpath))
@@ -221,9 +223,7 @@ class EC2NodeDriver(NodeDriver):
 
     def _get_terminate_boolean(self, element):
         status = element.findtext(".//{%s}%s" % (NAMESPACE, 'name'))
-        return any([ term_status == status
-                     for term_status
-                     in ('shutting-down', 'terminated') ])
+        return status in TERMINATE_STATUSES
 
     def _to_nodes(self, object, xpath):
         return [ self._to_node(el) 
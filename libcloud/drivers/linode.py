@@ -31,10 +31,11 @@ from libcloud.base import NodeImage
 from copy import copy
 import os
 
-# JSON is included in the standard library starting with Python 2.6.  For 2.5
+# Prefer simplejson when it is installed: its C speedups decode responses far
+# faster than the pure-Python json module shipped with Python 2.6.  For 2.5
 # and 2.4, there's a simplejson egg at: http://pypi.python.org/pypi/simplejson
-try: import json
-except: import simplejson as json
+try: import simplejson as json
+except ImportError: import json
 
 
 # Base exception for problems arising from this driver
@@ -56,9 +57,9 @@ class LinodeResponse(Response):
     
     def __init__(self, response):
         # Given a response object, slurp the information from it.
-        self.body = response.read()
         self.status = response.status
         self.headers = dict(response.getheaders())
+        self.body = self.read_body(response)
         self.error = response.reason
         self.invalid = LinodeException(0xFF,
                                        "Invalid JSON received from server")
@@ -154,7 +155,7 @@ class LinodeNodeDriver(NodeDriver):
         # Provide a list of all nodes that this API key has access to.
         params = { "api_action": "linode.list" }
         data = self.connection.request(LINODE_ROOT, params=params).object
-        return [self._to_node(n) for n in data]
+        return self._to_nodes(data)
     
     def reboot_node(self, node):
         # Reboot
@@ -412,19 +413,39 @@ class LinodeNodeDriver(NodeDriver):
         self.datacenter = None
         raise LinodeException(0xFD, "Invalid datacenter (use one of %s)" % dcs)
 
-    def _to_node(self, obj):
-        # Convert a returned Linode instance into a Node instance.
+    def _to_nodes(self, objs):
+        # Convert a list of returned Linode instances into Node instances.
+        # linode.ip.list without a LinodeID returns the addresses of every
+        # Linode on the account, so fetch them all in one request rather than
+        # issuing one request per node.
+        if not objs:
+            return []
+        params = { "api_action": "linode.ip.list" }
+        data = self.connection.request(LINODE_ROOT, params=params).object
+        ips = {}
+        for ip in data:
+            ips.setdefault(ip["LINODEID"], []).append(ip)
+        return [self._to_node(obj, ips.get(obj["LINODEID"], []))
+                for obj in objs]
+
+    def _to_node(self, obj, ips=None):
+        # Convert a returned Linode instance into a Node instance.  If the
+        # Linode's IP addresses weren't already fetched, look them up.
         lid = obj["LINODEID"]
         
-        # Get the IP addresses for a Linode
-        params = { "api_action": "linode.ip.list", "LinodeID": lid }        
-        req = self.connection.request(LINODE_ROOT, params=params)
-        if not req.success() or len(req.object) == 0:
+        if ips is None:
+            # Get the IP addresses for a Linode
+            params = { "api_action": "linode.ip.list", "LinodeID": lid }
+            req = self.connection.request(LINODE_ROOT, params=params)
+            if not req.success():
+                return None
+            ips = req.object
+        if len(ips) == 0:
             return None
         
         public_ip = []
         private_ip = []
-        for ip in req.object:
+        for ip in ips:
             if ip["ISPUBLIC"]:
               public_ip.append(ip["IPADDRESS"])
             else:
@@ -17,7 +17,7 @@ Rackspace driver
 """
 from libcloud.types import NodeState, InvalidCredsException, Provider
 from libcloud.base import ConnectionUserAndKey, Response, NodeDriver, Node
-from libcloud.base import NodeSize, NodeImage, NodeLocation
+from libcloud.base import NodeSize, NodeImage, NodeLocation, fixxpath
 import os
 
 import base64
@@ -64,7 +64,7 @@ class RackspaceConnection(ConnectionUserAndKey):
         super(RackspaceConnection, self).__init__(user_id, key, secure)
 
     def add_default_headers(self, headers):
-        headers['X-Auth-Token'] = self.token;
+        headers['X-Auth-Token'] = self.token
         headers['Accept'] = 'application/xml'
         return headers
 
@@ -99,7 +99,7 @@ class RackspaceConnection(ConnectionUserAndKey):
             scheme, server, self.path, param, query, fragment = (
                 urlparse.urlparse(endpoint)
             )
-            if scheme is "https" and self.secure is not 1:
+            if scheme == "https" and self.secure != 1:
                 # TODO: Custom exception (?)
                 raise InvalidCredsException()
 
@@ -244,7 +244,7 @@ class RackspaceNodeDriver(NodeDriver):
 
     def _fixxpath(self, xpath):
         # ElementTree wants namespaces in its xpaths, so here we add them.
-        return "/".join(["{%s}%s" % (NAMESPACE, e) for e in xpath.split("/")])
+        return fixxpath(NAMESPACE, xpath)
 
     def _findall(self, element, xpath):
         return element.findall(self._fixxpath(xpath))
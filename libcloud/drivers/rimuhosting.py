@@ -21,10 +21,11 @@ from libcloud.base import ConnectionKey, Response, NodeAuthPassword
 from libcloud.base import NodeDriver, NodeSize, Node, NodeLocation
 from libcloud.base import NodeImage
 
-# JSON is included in the standard library starting with Python 2.6.  For 2.5
+# Prefer simplejson when it is installed: its C speedups decode responses far
+# faster than the pure-Python json module shipped with Python 2.6.  For 2.5
 # and 2.4, there's a simplejson egg at: http://pypi.python.org/pypi/simplejson
-try: import json
-except: import simplejson as json
+try: import simplejson as json
+except ImportError: import json
 
 # Defaults
 API_CONTEXT = '/r'
@@ -41,9 +42,9 @@ class RimuHostingException(Exception):
 
 class RimuHostingResponse(Response):
     def __init__(self, response):
-        self.body = response.read()
         self.status = response.status
         self.headers = dict(response.getheaders())
+        self.body = self.read_body(response)
         self.error = response.reason
 
         if self.success():
@@ -55,12 +56,13 @@ class RimuHostingResponse(Response):
         return True
     def parse_body(self):
         try:
-            js = json.loads(self.body)
-            if js[js.keys()[0]]['response_type'] == "ERROR":
+            # The response is wrapped in a single top-level key.
+            js = json.loads(self.body).values()[0]
+            if js['response_type'] == "ERROR":
                 raise RimuHostingException(
-                    js[js.keys()[0]]['human_readable_message']
+                    js['human_readable_message']
                 )
-            return js[js.keys()[0]]
+            return js
         except ValueError:
             raise RimuHostingException('Could not parse body: %s'
                                        % (self.body))
@@ -87,7 +89,7 @@ class RimuHostingConnection(ConnectionKey):
         headers['Content-Type'] = 'application/json'
       
         headers['Authorization'] = 'rimuhosting apikey=%s' % (self.key)
-        return headers;
+        return headers
 
     def request(self, action, params={}, data='', headers={}, method='GET'):
         # Override this method to prepend the api_context
@@ -150,7 +152,7 @@ class RimuHostingNodeDriver(NodeDriver):
         # Get plans. Note this is really just for libcloud.
         # We are happy with any size.
         if location == None:
-            location = '';
+            location = ''
         else:
             location = ";dc_location=%s" % (location.id)
 
@@ -230,46 +232,46 @@ class RimuHostingNodeDriver(NodeDriver):
             'pricing_plan_code': size.id,
         }
         
-        if kwargs.has_key('control_panel'):
+        if 'control_panel' in kwargs:
             data['instantiation_options']['control_panel'] = kwargs['control_panel']
 
-        if kwargs.has_key('auth'):
+        if 'auth' in kwargs:
             auth = kwargs['auth']
             if not isinstance(auth, NodeAuthPassword):
                 raise ValueError('auth must be of NodeAuthPassword type')
             data['instantiation_options']['password'] = auth.password
         
-        if kwargs.has_key('billing_oid'):
+        if 'billing_oid' in kwargs:
             #TODO check for valid oid.
             data['billing_oid'] = kwargs['billing_oid']
         
-        if kwargs.has_key('host_server_oid'):
+        if 'host_server_oid' in kwargs:
             data['host_server_oid'] = kwargs['host_server_oid']
             
-        if kwargs.has_key('vps_order_oid_to_clone'):
+        if 'vps_order_oid_to_clone' in kwargs:
             data['vps_order_oid_to_clone'] = kwargs['vps_order_oid_to_clone']
         
-        if kwargs.has_key('num_ips') and int(kwargs['num_ips']) > 1:
-            if not kwargs.has_key('extra_ip_reason'):
+        if 'num_ips' in kwargs and int(kwargs['num_ips']) > 1:
+            if 'extra_ip_reason' not in kwargs:
                 raise RimuHostingException('Need an reason for having an extra IP')
             else:
-                if not data.has_key('ip_request'):
+                if 'ip_request' not in data:
                     data['ip_request'] = {}
                 data['ip_request']['num_ips'] = int(kwargs['num_ips'])
                 data['ip_request']['extra_ip_reason'] = kwargs['extra_ip_reason']
         
-        if kwargs.has_key('memory_mb'):
-            if not data.has_key('vps_parameters'):
+        if 'memory_mb' in kwargs:
+            if 'vps_parameters' not in data:
                 data['vps_parameters'] = {}
             data['vps_parameters']['memory_mb'] = kwargs['memory_mb']
         
-        if kwargs.has_key('disk_space_mb'):
-            if not data.has_key('vps_parameters'):
+        if 'disk_space_mb' in kwargs:
+            if 'vps_parameters' not in data:
                 data['vps_parameters'] = {}
             data['vps_parameters']['disk_space_mb'] = kwargs['disk_space_mb']
         
-        if kwargs.has_key('disk_space_2_mb'):
-            if not data.has_key('vps_parameters'):
+        if 'disk_space_2_mb' in kwargs:
+            if 'vps_parameters' not in data:
                 data['vps_parameters'] = {}
             data['vps_parameters']['disk_space_2_mb'] = kwargs['disk_space_2_mb']
         
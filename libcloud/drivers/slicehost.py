@@ -24,6 +24,16 @@ import socket
 from xml.etree import ElementTree as ET
 from xml.parsers.expat import ExpatError
 
+def _unpack_subnet(subnet, mask):
+    subnet = struct.unpack('I',socket.inet_aton(subnet))[0]
+    mask = struct.unpack('I',socket.inet_aton(mask))[0]
+    return (subnet & mask, mask)
+
+# Unpacked once at import time so checking an address is just a bitmask test.
+PRIVATE_SUBNETS = [ _unpack_subnet('10.0.0.0', '255.0.0.0'),
+                    _unpack_subnet('172.16.0.0', '172.16.0.0'),
+                    _unpack_subnet('192.168.0.0', '192.168.0.0') ]
+
 class SlicehostResponse(Response):
 
     def parse_body(self):
@@ -46,9 +56,14 @@ class SlicehostConnection(ConnectionKey):
     host = 'api.slicehost.com'
     responseCls = SlicehostResponse
 
+    def __init__(self, key, secure=True):
+        super(SlicehostConnection, self).__init__(key, secure)
+        # The key never changes, so only encode it once
+        self.auth_header = ('Basic %s'
+                            % (base64.b64encode('%s:' % self.key)))
+
     def add_default_headers(self, headers):
-        headers['Authorization'] = ('Basic %s'
-                              % (base64.b64encode('%s:' % self.key)))
+        headers['Authorization'] = self.auth_header
         return headers
     
 
@@ -117,10 +132,15 @@ class SlicehostNodeDriver(NodeDriver):
         #expected_status = 'hard_reboot' if hard else 'reboot'
 
         uri = '/slices/%s/reboot.xml' % (node.id)
-        node = self._to_nodes(
-            self.connection.request(uri, method='PUT').object
-        )[0]
-        return node.state == NodeState.REBOOTING
+        element = self.connection.request(uri, method='PUT').object
+        # Only the state is needed, so read the status straight from the
+        # returned slice instead of building a full Node from it.
+        if element.tag != 'slice':
+            element = element.find('slice')
+            if element is None:
+                return False
+        state = self.NODE_STATE_MAP.get(element.findtext('status'))
+        return state == NodeState.REBOOTING
 
     def destroy_node(self, node):
         """Destroys the node
@@ -133,7 +153,7 @@ class SlicehostNodeDriver(NodeDriver):
             </errors>
         """
         uri = '/slices/%s/destroy.xml' % (node.id)
-        ret = self.connection.request(uri, method='PUT')
+        self.connection.request(uri, method='PUT')
         return True
 
     def _to_nodes(self, object):
@@ -144,13 +164,6 @@ class SlicehostNodeDriver(NodeDriver):
 
     def _to_node(self, element):
 
-        attrs = [ 'name', 'image-id', 'progress', 'id', 'bw-out', 'bw-in', 
-                  'flavor-id', 'status', 'ip-address' ]
-
-        node_attrs = {}
-        for attr in attrs:
-            node_attrs[attr] = element.findtext(attr)
-
         # slicehost does not determine between public and private, so we 
         # have to figure it out
         public_ip = element.findtext('ip-address')
@@ -210,17 +223,10 @@ class SlicehostNodeDriver(NodeDriver):
 
 
     def _is_private_subnet(self, ip):
-        priv_subnets = [ {'subnet': '10.0.0.0', 'mask': '255.0.0.0'},
-                         {'subnet': '172.16.0.0', 'mask': '172.16.0.0'},
-                         {'subnet': '192.168.0.0', 'mask': '192.168.0.0'} ]
-
         ip = struct.unpack('I',socket.inet_aton(ip))[0]
 
-        for network in priv_subnets:
-            subnet = struct.unpack('I',socket.inet_aton(network['subnet']))[0]
-            mask = struct.unpack('I',socket.inet_aton(network['mask']))[0]
-
-            if (ip & mask) == (subnet & mask):
+        for subnet, mask in PRIVATE_SUBNETS:
+            if (ip & mask) == subnet:
                 return True
             
         return False
@@ -22,6 +22,7 @@ from libcloud.base import NodeSize, NodeImage, NodeAuthPassword, NodeLocation
 
 import base64
 import httplib
+import socket
 import time
 from urlparse import urlparse
 from xml.etree import ElementTree as ET
@@ -35,12 +36,15 @@ VIRTUAL_MEMORY_VALS = [512] + [1024 * i for i in range(1,9)]
 
 DEFAULT_TASK_COMPLETION_TIMEOUT = 600
 
+SUCCESS_STATUSES = frozenset((httplib.OK, httplib.CREATED,
+                              httplib.NO_CONTENT, httplib.ACCEPTED))
+
 def get_url_path(url):
     return urlparse(url.strip()).path
 
 def fixxpath(root, xpath):
     """ElementTree wants namespaces in its xpaths, so here we add them."""
-    namespace, root_tag = root.tag[1:].split("}", 1)
+    namespace = root.tag[1:].partition("}")[0]
     fixed_xpath = "/".join(["{%s}%s" % (namespace, e)
                             for e in xpath.split("/")])
     return fixed_xpath
@@ -70,8 +74,8 @@ class InstantiateVAppXML(object):
         instantionation_params = ET.SubElement(self.root,
                                                "InstantiationParams")
 
-        product = self._make_product_section(instantionation_params)
-        virtual_hardware = self._make_virtual_hardware(instantionation_params)
+        self._make_product_section(instantionation_params)
+        self._make_virtual_hardware(instantionation_params)
         network_config_section = ET.SubElement(instantionation_params,
                                                "NetworkConfigSection")
 
@@ -207,8 +211,7 @@ class VCloudResponse(Response):
         return self.error
 
     def success(self):
-        return self.status in (httplib.OK, httplib.CREATED,
-                               httplib.NO_CONTENT, httplib.ACCEPTED)
+        return self.status in SUCCESS_STATUSES
 
 class VCloudConnection(ConnectionUserAndKey):
 
@@ -235,14 +238,19 @@ class VCloudConnection(ConnectionUserAndKey):
 
     def _get_auth_token(self):
         if not self.token:
-            conn = self.conn_classes[self.secure](self.host,
-                                                  self.port[self.secure])
-            conn.request(method='POST', url='/api/v0.8/login',
-                         headers=self._get_auth_headers())
-
-            resp = conn.getresponse()
-            headers = dict(resp.getheaders())
-            body = ET.XML(resp.read())
+            # Log in over the same persistent connection that later requests
+            # use, so authenticating doesn't cost an extra SSL handshake.
+            if self.connection is None:
+                self.connect()
+            resp = self._send_request('POST', '/api/v0.8/login', '',
+                                      self._get_auth_headers())
+            try:
+                headers = dict(resp.getheaders())
+                body = ET.XML(resp.read())
+            except (httplib.HTTPException, socket.error):
+                # The body couldn't be read, so the connection is unusable
+                self.close()
+                raise
 
             try:
                 self.token = headers['set-cookie']
@@ -366,7 +374,7 @@ class VCloudNodeDriver(NodeDriver):
                                           % node_path,
                                           method='POST')
             self._wait_for_task_completion(res.object.get('href'))
-        except Exception, e:
+        except Exception:
             pass
 
         try:
@@ -377,7 +385,7 @@ class VCloudNodeDriver(NodeDriver):
             # The undeploy response is malformed XML atm.
             # We can remove this whent he providers fix the problem.
             pass
-        except Exception, e:
+        except Exception:
             # Some vendors don't implement undeploy at all yet,
             # so catch this and move on.
             pass
@@ -515,7 +523,7 @@ class VCloudNodeDriver(NodeDriver):
             network = ''
 
         password = None
-        if kwargs.has_key('auth'):
+        if 'auth' in kwargs:
             auth = kwargs['auth']
             if isinstance(auth, NodeAuthPassword):
                 password = auth.password
@@ -554,8 +562,8 @@ class VCloudNodeDriver(NodeDriver):
         self._wait_for_task_completion(res.object.get('href'))
 
         # Power on the VM.
-        res = self.connection.request('%s/power/action/powerOn' % vapp_href,
-                                      method='POST')
+        self.connection.request('%s/power/action/powerOn' % vapp_href,
+                                method='POST')
 
         res = self.connection.request(vapp_href)
         node = self._to_node(vapp_name, res.object)
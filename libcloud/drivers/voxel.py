@@ -78,8 +78,7 @@ class VoxelConnection(ConnectionUserAndKey):
             if params[param] is None:
                 del params[param]
 
-        keys = params.keys()
-        keys.sort()
+        keys = sorted(params)
 
         md5 = hashlib.md5()
         md5.update(self.key)
@@ -22,10 +22,11 @@ from libcloud.base import NodeSize, NodeImage, NodeLocation
 
 import base64
 
-# JSON is included in the standard library starting with Python 2.6.  For 2.5
+# Prefer simplejson when it is installed: its C speedups decode responses far
+# faster than the pure-Python json module shipped with Python 2.6.  For 2.5
 # and 2.4, there's a simplejson egg at: http://pypi.python.org/pypi/simplejson
-try: import json
-except: import simplejson as json
+try: import simplejson as json
+except ImportError: import json
 
 API_HOST = 'api.vps.net'
 API_VERSION = 'api10json'
@@ -73,9 +74,14 @@ class VPSNetConnection(ConnectionUserAndKey):
     host = API_HOST
     responseCls = VPSNetResponse
 
-    def add_default_headers(self, headers):
+    def __init__(self, user_id, key, secure=True):
+        super(VPSNetConnection, self).__init__(user_id, key, secure)
+        # The credentials never change, so only encode them once
         user_b64 = base64.b64encode('%s:%s' % (self.user_id, self.key))
-        headers['Authorization'] = 'Basic %s' % (user_b64)
+        self.auth_header = 'Basic %s' % (user_b64)
+
+    def add_default_headers(self, headers):
+        headers['Authorization'] = self.auth_header
         return headers
 
 class VPSNetNodeDriver(NodeDriver):
@@ -116,7 +122,7 @@ class VPSNetNodeDriver(NodeDriver):
         return size
 
     def _get_price_per_node(self, num):
-        keys = sorted(PRICE_PER_NODE.keys())
+        keys = sorted(PRICE_PER_NODE)
 
         if num >= max(keys):
             return PRICE_PER_NODE[keys[-1]]
@@ -142,11 +148,12 @@ class VPSNetNodeDriver(NodeDriver):
         return node
 
     def reboot_node(self, node):
+        # The status code is enough to report success; there's no need to
+        # build a Node from the returned virtual machine.
         res = self.connection.request('/virtual_machines/%s/%s.%s' % 
                                         (node.id, 'reboot', API_VERSION),
                                         method="POST")
-        node = self._to_node(res.object['virtual_machine'])
-        return True
+        return res.status == 200
     
     def list_sizes(self, location=None):
         res = self.connection.request('/nodes.%s' % (API_VERSION,))
@@ -12,7 +12,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import gzip
+import httplib
+import socket
 import unittest
+from cStringIO import StringIO
 
 from libcloud.providers import DRIVERS, get_driver
 from libcloud.types import InvalidCredsException, Provider
@@ -24,11 +28,26 @@ from libcloud.interface import IResponse, INode, INodeSize, INodeImage, INodeDri
 from libcloud.interface import IConnectionKey, IConnectionUserAndKey
 from libcloud.base import Response, Node, NodeSize, NodeImage, NodeDriver
 from libcloud.base import ConnectionKey, ConnectionUserAndKey
+from libcloud.base import LoggingHTTPSConnection, fixxpath
 
-from test import MockResponse
+from test import MockHttp, MockResponse
 
 class FakeDriver(object):
     type = 0 
+    name = 'fake'
+
+class HeaderRecordingMockHttp(MockHttp):
+    """
+    Remembers the headers of the last request it was sent.
+    """
+    headers = None
+
+    def request(self, method, url, body=None, headers=None):
+        HeaderRecordingMockHttp.headers = headers
+        MockHttp.request(self, method, url, body, headers)
+
+class LoggingMockHttp(HeaderRecordingMockHttp, LoggingHTTPSConnection):
+    pass
 
 class BaseTests(unittest.TestCase):
 
@@ -50,6 +69,27 @@ class BaseTests(unittest.TestCase):
         verifyObject(IResponse, Response(MockResponse(status=200,
                                                       body='foo')))
 
+    def test_base_response_gzip(self):
+        compressed = StringIO()
+        gz = gzip.GzipFile(fileobj=compressed, mode='wb')
+        gz.write('foo')
+        gz.close()
+        response = Response(MockResponse(status=200,
+                                         body=compressed.getvalue(),
+                                         headers={'content-encoding': 'gzip'}))
+        self.assertEqual(response.body, 'foo')
+
+    def test_base_response_corrupt_gzip(self):
+        mock = MockResponse(status=200, body='not gzip',
+                            headers={'content-encoding': 'gzip'})
+        try:
+            Response(mock)
+        except Exception, e:
+            self.assertTrue('status 200' in e.args[0])
+            self.assertTrue('not gzip' in e.args[0])
+        else:
+            self.fail('corrupt gzip body should have raised')
+
     def test_base_node_driver(self):
         node_driver = NodeDriver('foo')
         verifyObject(INodeDriver, node_driver)
@@ -62,6 +102,37 @@ class BaseTests(unittest.TestCase):
         conn = ConnectionUserAndKey('foo', 'bar')
         verifyObject(IConnectionUserAndKey, conn)
 
+    def test_connection_requests_gzip(self):
+        conn = ConnectionKey('foo')
+        conn.conn_classes = (None, HeaderRecordingMockHttp)
+        conn.driver = FakeDriver()
+        conn.request('/example')
+        self.assertEqual(HeaderRecordingMockHttp.headers['Accept-Encoding'],
+                         'gzip')
+
+    def test_logging_connection_skips_gzip(self):
+        conn = ConnectionKey('foo')
+        conn.conn_classes = (None, LoggingMockHttp)
+        conn.driver = FakeDriver()
+        conn.request('/example')
+        self.assertFalse('Accept-Encoding' in HeaderRecordingMockHttp.headers)
+
+    def test_connection_reused_between_requests(self):
+        conn = ConnectionKey('foo')
+        conn.conn_classes = (None, MockHttp)
+        conn.driver = FakeDriver()
+        conn.connect()
+        http = conn.connection
+        conn.request('/example')
+        conn.request('/example')
+        self.assertTrue(conn.connection is http)
+
+    def test_fixxpath(self):
+        self.assertEqual(fixxpath('urn:a', 'servers/server'),
+                         '{urn:a}servers/{urn:a}server')
+        self.assertEqual(fixxpath('urn:b', 'servers/server'),
+                         '{urn:b}servers/{urn:b}server')
+
 #    def test_drivers_interface(self):
 #        failures = []
 #        for driver in DRIVERS:
@@ -91,3 +162,68 @@ class BaseTests(unittest.TestCase):
 #        if failures:
 #            self.fail('the following drivers did not throw an \
 #                       InvalidCredsException: %s' % (', '.join(failures)))
+
+class FlakyMockHttp(MockHttp):
+    """
+    Records each request it is sent, raising any queued errors first.
+    """
+    sent = []
+    errors = []
+
+    def request(self, method, url, body=None, headers=None):
+        FlakyMockHttp.sent.append(method)
+        if FlakyMockHttp.errors:
+            raise FlakyMockHttp.errors.pop(0)
+        MockHttp.request(self, method, url, body, headers)
+
+class ConnectionRetryTests(unittest.TestCase):
+
+    def setUp(self):
+        FlakyMockHttp.sent = []
+        FlakyMockHttp.errors = []
+        self.conn = ConnectionKey('foo')
+        self.conn.conn_classes = (None, FlakyMockHttp)
+        self.conn.driver = FakeDriver()
+        self.conn.connect()
+
+    def test_stale_connection_is_retried(self):
+        self.conn.request('/example')
+        http = self.conn.connection
+        FlakyMockHttp.errors = [httplib.BadStatusLine('')]
+        self.conn.request('/example')
+        self.assertEqual(FlakyMockHttp.sent, ['GET', 'GET', 'GET'])
+        self.assertTrue(self.conn.connection is not None)
+        self.assertTrue(self.conn.connection is not http)
+
+    def test_fresh_connection_is_not_retried(self):
+        FlakyMockHttp.errors = [httplib.BadStatusLine('')]
+        self.assertRaises(httplib.BadStatusLine, self.conn.request, '/example')
+        self.assertEqual(FlakyMockHttp.sent, ['GET'])
+        self.assertTrue(self.conn.connection is None)
+
+    def test_post_is_not_retried(self):
+        self.conn.request('/example')
+        FlakyMockHttp.errors = [httplib.BadStatusLine('')]
+        self.assertRaises(httplib.BadStatusLine, self.conn.request,
+                          '/example', method='POST')
+        self.assertEqual(FlakyMockHttp.sent, ['GET', 'POST'])
+        self.assertTrue(self.conn.connection is None)
+
+    def test_timeout_is_not_retried(self):
+        self.conn.request('/example')
+        FlakyMockHttp.errors = [socket.timeout('timed out')]
+        self.assertRaises(socket.timeout, self.conn.request, '/example')
+        self.assertEqual(FlakyMockHttp.sent, ['GET', 'GET'])
+        self.assertTrue(self.conn.connection is None)
+
+    def test_recovers_after_failed_retry(self):
+        self.conn.request('/example')
+        FlakyMockHttp.errors = [httplib.BadStatusLine(''),
+                                socket.error('connection refused')]
+        self.assertRaises(socket.error, self.conn.request, '/example')
+        self.assertEqual(FlakyMockHttp.sent, ['GET', 'GET', 'GET'])
+        self.assertTrue(self.conn.connection is None)
+
+        response = self.conn.request('/example')
+        self.assertEqual(response.body, 'Hello World!')
+        self.assertEqual(len(FlakyMockHttp.sent), 4)
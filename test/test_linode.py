@@ -23,6 +23,8 @@ from test import MockHttp, TestCaseMixin
 
 import unittest
 import httplib
+import urlparse
+from cgi import parse_qs
 
 class LinodeTest(unittest.TestCase, TestCaseMixin):
     # The Linode test suite
@@ -30,6 +32,7 @@ class LinodeTest(unittest.TestCase, TestCaseMixin):
     def setUp(self):
         LinodeNodeDriver.connectionCls.conn_classes = (None, LinodeMockHttp)
         LinodeMockHttp.use_param = 'api_action'
+        LinodeMockHttp.queries = []
         self.driver = LinodeNodeDriver('foo')
 
     def test_list_nodes(self):
@@ -40,6 +43,17 @@ class LinodeTest(unittest.TestCase, TestCaseMixin):
         self.assertEqual(node.name, 'api-node3')
         self.assertTrue('75.127.96.245' in node.public_ip)
         self.assertEqual(node.private_ip, [])
+
+    def test_list_nodes_fetches_ips_once(self):
+        self.driver.list_nodes()
+        ip_lists = [q for q in LinodeMockHttp.queries
+                    if q['api_action'] == ['linode.ip.list']]
+        self.assertEqual(len(ip_lists), 1)
+        self.assertFalse('LinodeID' in ip_lists[0])
+
+    def test_to_nodes_without_nodes(self):
+        self.assertEqual(self.driver._to_nodes([]), [])
+        self.assertEqual(LinodeMockHttp.queries, [])
     
     def test_reboot_node(self):
         # An exception would indicate failure
@@ -80,6 +94,13 @@ class LinodeTest(unittest.TestCase, TestCaseMixin):
 
         
 class LinodeMockHttp(MockHttp):
+    queries = []
+
+    def request(self, method, url, body=None, headers=None):
+        query = urlparse.urlparse(url)[4]
+        LinodeMockHttp.queries.append(parse_qs(query))
+        MockHttp.request(self, method, url, body, headers)
+
     def _avail_datacenters(self, method, url, body, headers):
         body = '{"ERRORARRAY":[],"ACTION":"avail.datacenters","DATA":[{"DATACENTERID":2,"LOCATION":"Dallas, TX, USA"},{"DATACENTERID":3,"LOCATION":"Fremont, CA, USA"},{"DATACENTERID":4,"LOCATION":"Atlanta, GA, USA"},{"DATACENTERID":6,"LOCATION":"Newark, NJ, USA"}]}'
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
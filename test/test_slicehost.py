@@ -80,6 +80,13 @@ class SlicehostTest(unittest.TestCase, TestCaseMixin):
         else:
             self.fail('test should have thrown')
 
+    def test_reboot_node_without_slice(self):
+        node = Node(id=1, name=None, state=None, public_ip=None, private_ip=None,
+                    driver=self.driver)
+        SlicehostMockHttp.type = 'NO_SLICE'
+        ret = self.driver.reboot_node(node)
+        self.assertTrue(ret is False)
+
     def test_destroy_node(self):
         node = Node(id=1, name=None, state=None, public_ip=None, private_ip=None,
                     driver=self.driver)
@@ -285,6 +292,11 @@ class SlicehostMockHttp(MockHttp):
         return (httplib.FORBIDDEN, err_body, {}, 
                  httplib.responses[httplib.FORBIDDEN])
 
+    def _slices_1_reboot_xml_NO_SLICE(self, method, url, body, headers):
+        body = """<slices type="array">
+</slices>"""
+        return (httplib.OK, body, {}, httplib.responses[httplib.OK])
+
     def _slices_1_destroy_xml(self, method, url, body, headers):
         body = ''
         return (httplib.OK, body, {}, httplib.responses[httplib.OK])
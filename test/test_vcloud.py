@@ -76,6 +76,18 @@ class TerremarkTests(unittest.TestCase, TestCaseMixin):
         ret = self.driver.destroy_node(node)
         self.assertTrue(ret)
 
+    def test_failed_login_can_be_retried(self):
+        conn = self.driver.connection
+        conn.conn_classes = (None, DroppedLoginMockHttp)
+        conn.connect()
+        DroppedLoginMockHttp.drop = True
+        self.assertRaises(httplib.BadStatusLine, self.driver.list_nodes)
+        self.assertTrue(conn.connection is None)
+        self.assertEqual(conn.token, None)
+
+        node = self.driver.list_nodes()[0]
+        self.assertEqual(node.name, 'testerpart2')
+
         
 class TerremarkMockHttp(MockHttp):
 
@@ -327,3 +339,21 @@ class TerremarkMockHttp(MockHttp):
         return (httplib.ACCEPTED, body, headers, httplib.responses[httplib.ACCEPTED])
 
       
+
+
+class DroppedLoginMockHttp(TerremarkMockHttp):
+    """
+    Drops the first login, then refuses to send anything else on the same
+    connection, the way httplib does after a request fails part way.
+    """
+    drop = False
+    broken = False
+
+    def request(self, method, url, body=None, headers=None):
+        if self.broken:
+            raise httplib.CannotSendRequest()
+        if DroppedLoginMockHttp.drop:
+            DroppedLoginMockHttp.drop = False
+            self.broken = True
+            raise httplib.BadStatusLine('')
+        TerremarkMockHttp.request(self, method, url, body, headers)